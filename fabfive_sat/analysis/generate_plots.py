@@ -0,0 +1,76 @@
+from __future__ import annotations
+import argparse
+from pathlib import Path
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import pandas as pd
+
+LINE_METRICS = ["cpu_time", "peak_memory", "conflicts", "learned_clauses"]
+BAR_METRICS = ["decisions", "flips"]
+
+def ensure_output(path: Path) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+
+def save(ax: plt.Axes, output: Path) -> None:
+    ax.figure.tight_layout()
+    ax.figure.savefig(output)
+
+def line_plot(ax: plt.Axes, means: pd.DataFrame, metric: str, output: Path, ylabel: str) -> None:
+    ax.cla()
+    for solver, series in means[metric].groupby(level="solver"):
+        series = series.droplevel("solver").sort_index()
+        ax.plot(series.index, series.values, marker="o", label=solver)
+    ax.set_xlabel("num_vars")
+    ax.set_ylabel(ylabel)
+    ax.legend()
+    save(ax, output)
+
+def stacked_plot(ax: plt.Axes, df: pd.DataFrame, output: Path) -> None:
+    ax.cla()
+    pivot = df.groupby(["num_vars", "problem_type"], sort=True)["cpu_time"].mean().unstack("problem_type")
+    pivot.plot(kind="bar", ax=ax)
+    ax.set_xlabel("num_vars")
+    ax.set_ylabel("cpu_time")
+    save(ax, output)
+
+def metric_bar(ax: plt.Axes, agg: pd.Series, metric: str, output: Path) -> None:
+    ax.cla()
+    agg.sort_values(ascending=False).plot(kind="bar", ax=ax)
+    ax.set_ylabel(metric)
+    save(ax, output)
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", required=True)
+    parser.add_argument("--output", default="results/plots")
+    args = parser.parse_args()
+    df = pd.read_csv(args.input).sort_values("num_vars", kind="stable")
+    output_dir = Path(args.output)
+    ensure_output(output_dir)
+    by_solver_vars = df.groupby(["solver", "num_vars"])[LINE_METRICS].mean()
+    by_solver = df.groupby("solver")[BAR_METRICS].mean()
+    random_flips = df[df["problem_type"] == "random_3sat"].groupby("solver")["flips"].mean()
+    fig, ax = plt.subplots()
+    line_plot(ax, by_solver_vars, "cpu_time", output_dir / "cpu_time_vs_vars.png", "cpu_time")
+    line_plot(ax, by_solver_vars, "peak_memory", output_dir / "peak_memory_vs_vars.png", "peak_memory")
+    stacked_plot(ax, df, output_dir / "cpu_time_by_problem_type.png")
+    metric_bar(ax, random_flips, "flips", output_dir / "random_flips.png")
+    solvers_decisions = ["dpll_baseline", "dpll_jw", "cdcl"]
+    decisions = by_solver.loc[by_solver.index.isin(solvers_decisions), "decisions"]
+    if not decisions.empty:
+        metric_bar(ax, decisions, "decisions", output_dir / "decisions_comparison.png")
+
+    solvers_flips = ["walksat", "probsat"]
+    flips = by_solver.loc[by_solver.index.isin(solvers_flips), "flips"]
+    if not flips.empty:
+        metric_bar(ax, flips, "flips", output_dir / "flips_comparison.png")
+
+    cdcl_means = by_solver_vars.loc[by_solver_vars.index.get_level_values("solver") == "cdcl"]
+    if not cdcl_means.empty:
+        line_plot(ax, cdcl_means, "conflicts", output_dir / "cdcl_conflicts.png", "conflicts")
+        line_plot(ax, cdcl_means, "learned_clauses", output_dir / "cdcl_learned_clauses.png", "learned_clauses")
+    plt.close(fig)
+
+if __name__ == "__main__":
+    main()
@@ -6,19 +6,24 @@ import urllib.request
 import zipfile
 from pathlib import Path
 from typing import Optional
-ROOT = Path(__file__).resolve().parents[1]
-BENCH_DIR = ROOT / "benchmarks"
+SPOOL_LIMIT = 256 << 20
+
+class _SpooledBuffer(tempfile.SpooledTemporaryFile):
+    # Python 3.10's SpooledTemporaryFile lacks seekable(), which ZipFile calls when reading members.
+    def seekable(self) -> bool:
+        return True
 
 def _download_zip(url: str, dest_dir: Path) -> None:
     dest_dir.mkdir(parents=True, exist_ok=True)
-    with tempfile.TemporaryDirectory() as td:
-        tmp_zip = Path(td) / "dataset.zip"
-        urllib.request.urlretrieve(url, tmp_zip)
-        with zipfile.ZipFile(tmp_zip, "r") as zf:
+    # Archives up to SPOOL_LIMIT stay in memory; larger ones spill to a single temp file.
+    with urllib.request.urlopen(url) as response, _SpooledBuffer(max_size=SPOOL_LIMIT) as buffer:
+        shutil.copyfileobj(response, buffer, 1 << 20)
+        buffer.seek(0)
+        with zipfile.ZipFile(buffer, "r") as zf:
             zf.extractall(dest_dir)
 
-def ensure_dataset(dataset: str, url: Optional[str]) -> None:
-    target = BENCH_DIR / dataset
+def ensure_dataset(dataset: str, url: Optional[str], bench_dir: Path = Path("benchmarks")) -> None:
+    target = bench_dir / dataset
     if target.exists() and any(target.rglob("*.cnf")):
         return
     if not url:
@@ -0,0 +1,246 @@
+from __future__ import annotations
+import argparse
+import csv
+import os
+import pickle
+import random
+import resource
+import sys
+import time
+import traceback
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+from fabfive_sat.solvers import cdcl, dpll_baseline, dpll_jw, probsat, walksat
+from fabfive_sat.utils.assignment_bits import decode_assignment
+from fabfive_sat.utils.cnf_parser import CNFFormula, parse_dimacs
+from fabfive_sat.harness.datasets import ensure_dataset
+
+FIELDNAMES = (
+    "solver",
+    "benchmark_file",
+    "problem_type",
+    "num_vars",
+    "num_clauses",
+    "status",
+    "cpu_time",
+    "elapsed_time",
+    "wall_time",
+    "peak_memory",
+    "decisions",
+    "unit_propagations",
+    "pure_eliminations",
+    "conflicts",
+    "learned_clauses",
+    "flips",
+    "restarts",
+    "verified",
+)
+# Every sign pattern over three variables: UNSAT, but only after decisions, propagation and backtracking.
+WARMUP = CNFFormula(num_vars=3, num_clauses=8, clauses=[[a, 2 * b, 3 * c] for a in (1, -1) for b in (1, -1) for c in (1, -1)])
+
+def _walk_cnf(root: str) -> Iterator[str]:
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_cnf(entry.path)
+            elif entry.name.endswith(".cnf"):
+                yield entry.path
+
+def collect_files(paths: Iterable[str]) -> List[Path]:
+    files: List[Path] = []
+    for raw in paths:
+        target = Path(raw)
+        if target.is_file() and target.suffix == ".cnf":
+            files.append(target)
+        elif target.is_dir():
+            found = sorted(_walk_cnf(raw), key=lambda path: path.split(os.sep))
+            files.extend(Path(path) for path in found)
+    return files
+
+def infer_problem_type(path: Path) -> str:
+    parts = [part.lower() for part in path.parts]
+    if "sudoku" in parts:
+        return "sudoku"
+    if "random_sat" in parts:
+        return "random_3sat"
+    return "unknown"
+
+def verify_assignment(clauses: List[List[int]], bits: str) -> bool:
+    if not bits:
+        return False
+    lengths = np.fromiter(map(len, clauses), dtype=np.int64, count=len(clauses))
+    lits = np.fromiter(chain.from_iterable(clauses), dtype=np.int32, count=int(lengths.sum()))
+    clause_idx = np.repeat(np.arange(len(clauses), dtype=np.int32), lengths)
+    var = np.abs(lits)
+    # -1 marks variables beyond the reported model, which satisfy no literal.
+    assign_arr = np.full(max(int(var.max(initial=0)), len(bits)) + 1, -1, dtype=np.int8)
+    assign_arr[: len(bits) + 1] = decode_assignment(bits)
+    val = assign_arr[var]
+    sat_lit = (val >= 0) & ((val == 1) == (lits > 0))
+    sat_clause = np.zeros(len(clauses), dtype=bool)
+    np.logical_or.at(sat_clause, clause_idx, sat_lit)
+    return bool(sat_clause.all())
+
+def build_runners(args: argparse.Namespace) -> Dict[str, object]:
+    return {
+        "dpll_baseline": lambda cnf, deadline: dpll_baseline.run_solver(cnf, deadline),
+        "dpll_jw": lambda cnf, deadline: dpll_jw.run_solver(cnf, deadline),
+        "cdcl": lambda cnf, deadline: cdcl.run_solver(cnf, deadline),
+        "walksat": lambda cnf, deadline: walksat.run_solver(cnf, args.walksat_max_flips, args.walksat_noise, args.walksat_restarts, deadline),
+        "probsat": lambda cnf, deadline: probsat.run_solver(cnf, args.probsat_max_flips, args.probsat_epsilon, args.probsat_restarts, deadline),
+    }
+
+def peak_rss() -> int:
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+def warm_worker(args: argparse.Namespace) -> None:
+    # Load every numba kernel once per worker; forked runs inherit them instead of compiling inside the timed region.
+    for runner in build_runners(args).values():
+        runner(WARMUP, None)
+
+def run_one(solver_name: str, cnf_path: Path, meta: CNFFormula, args: argparse.Namespace, seed: Optional[int]) -> Tuple[object, ...]:
+    if seed is not None:
+        random.seed(seed)
+    runner = build_runners(args)[solver_name]
+    if args.memory_profile:
+        tracemalloc.start()
+    start_rss = peak_rss()
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    timeout = args.solver_timeout
+    deadline = time.monotonic() + timeout if timeout and timeout > 0 else None
+    timed_out = False
+    try:
+        result = runner(meta, deadline)
+    except TimeoutError:
+        timed_out = True
+        result = {}
+    elapsed = time.perf_counter() - start_wall
+    cpu_used = time.process_time() - start_cpu
+    if args.memory_profile:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    else:
+        peak = peak_rss() - start_rss
+    status = result.get("status", "UNKNOWN") if not timed_out else "TIMEOUT"
+    wall_time = result.get("wall_time", elapsed) if not timed_out else elapsed
+    bits = result.get("assignment_bits", "")
+    verified = None
+    if status == "SAT" and bits:
+        try:
+            verified = verify_assignment(meta.clauses, bits)
+            if not verified:
+                status = "ERROR"
+        except Exception:
+            verified = False
+            status = "ERROR"
+    return (
+        solver_name,
+        str(cnf_path),
+        infer_problem_type(cnf_path),
+        meta.num_vars,
+        meta.num_clauses,
+        status,
+        cpu_used,
+        elapsed,
+        wall_time,
+        peak,
+        result.get("decisions"),
+        result.get("unit_propagations"),
+        result.get("pure_eliminations"),
+        result.get("conflicts"),
+        result.get("learned_clauses"),
+        result.get("flips"),
+        result.get("restarts"),
+        verified,
+    )
+
+def run_forked(solver_name: str, cnf_path: Path, meta: CNFFormula, args: argparse.Namespace, seed: Optional[int]) -> Tuple[object, ...]:
+    # A child forked per solve starts its ru_maxrss at its own RSS, so the growth covers this solve only.
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_fd)
+            try:
+                payload = (run_one(solver_name, cnf_path, meta, args, seed), None)
+            except BaseException:
+                payload = (None, traceback.format_exc())
+            with os.fdopen(write_fd, "wb") as pipe:
+                pickle.dump(payload, pipe)
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        data = pipe.read()
+    _, status = os.waitpid(pid, 0)
+    if not data:
+        raise RuntimeError(f"{solver_name} on {cnf_path} exited with status {status}")
+    row, error = pickle.loads(data)
+    if error is not None:
+        raise RuntimeError(error)
+    return row
+
+def run_file(cnf_path: Path, solver_names: List[str], args: argparse.Namespace, seed: Optional[int]) -> List[Tuple[object, ...]]:
+    meta = parse_dimacs(cnf_path)
+    return [
+        run_forked(solver_name, cnf_path, meta, args, None if seed is None else seed + offset)
+        for offset, solver_name in enumerate(solver_names)
+    ]
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--benchmarks", nargs="+", required=True)
+    parser.add_argument("--output", default="results/results.csv")
+    parser.add_argument("--solvers", nargs="+", default=["dpll_baseline", "dpll_jw", "cdcl", "walksat", "probsat"])
+    parser.add_argument("--walksat-max-flips", type=int, default=10000)
+    parser.add_argument("--walksat-noise", type=float, default=0.5)
+    parser.add_argument("--walksat-restarts", type=int, default=1)
+    parser.add_argument("--probsat-max-flips", type=int, default=10000)
+    parser.add_argument("--probsat-epsilon", type=float, default=0.5)
+    parser.add_argument("--probsat-restarts", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--solver-timeout", type=float, default=60.0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--memory-profile", action="store_true")
+    parser.add_argument("--download-if-missing", action="store_true")
+    parser.add_argument("--dataset-dir", type=Path, default=Path("benchmarks"))
+    parser.add_argument("--random3sat-url", type=str, default="")
+    parser.add_argument("--sudoku-url", type=str, default="")
+    args = parser.parse_args()
+    runners = build_runners(args)
+    if args.download_if_missing:
+        random_url = args.random3sat_url.strip() or None
+        sudoku_url = args.sudoku_url.strip() or None
+        for raw in args.benchmarks:
+            lower = raw.lower()
+            if "random_sat" in lower:
+                ensure_dataset("random_sat", random_url, args.dataset_dir)
+            if "sudoku" in lower:
+                ensure_dataset("sudoku", sudoku_url, args.dataset_dir)
+    selected = [name for name in args.solvers if name in runners]
+    files = collect_files(args.benchmarks)
+    results_dir = Path(args.output).parent
+    results_dir.mkdir(parents=True, exist_ok=True)
+    with Path(args.output).open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(FIELDNAMES)
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=warm_worker, initargs=(args,)) as executor:
+            futures = [
+                executor.submit(run_file, cnf_path, selected, args, None if args.seed is None else args.seed + index * len(selected))
+                for index, cnf_path in enumerate(files)
+            ]
+            # Submission order, so the CSV rows come out the same on every run.
+            for future in futures:
+                writer.writerows(future.result())
+                handle.flush()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import pandas as pd
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+from fabfive_sat.solvers import walksat
+
+FIELDNAMES = ("solver", "benchmark_file", "noise", "status", "flips", "elapsed_time")
+
+def run_one(noise: float, cnf_path: Path) -> tuple:
+    start_time = time.perf_counter()
+    result = walksat.run_solver(cnf_path, max_flips=10000, noise=noise, restarts=1)
+    elapsed = time.perf_counter() - start_time
+    return ("walksat", cnf_path.name, noise, result["status"], result["flips"], elapsed)
+
+def run_experiment(benchmarks_dir: Path, output_file: Path, workers: int = None):
+    noise_values = [0.1, 0.3, 0.5, 0.7]
+    benchmark_files = sorted(list(benchmarks_dir.glob("random_3sat_100v_*.cnf")))
+    if not benchmark_files:
+        return
+    tasks = [(noise, cnf_path) for noise in noise_values for cnf_path in benchmark_files]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run_one, *zip(*tasks)))
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame.from_records(results, columns=FIELDNAMES).to_csv(output_file, index=False)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--benchmarks", default="benchmarks/random_sat")
+    parser.add_argument("--output", default="results/parameter_sensitivity.csv")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+    run_experiment(Path(args.benchmarks), Path(args.output), args.workers)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+from __future__ import annotations
+import numpy as np
+try:
+    from numba import config as numba_config, njit
+    JIT_ENABLED = not numba_config.DISABLE_JIT
+except ImportError:
+    JIT_ENABLED = False
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+# JIT-compiled kernels for the CDCL hot loop. They operate purely on the SoA
+# arrays held by cdcl.SolverState and fall back to plain Python when numba is missing.
+
+# lit_true[2 * var + (literal < 0)] is 1 exactly when that polarity of var is currently true,
+# so "is literal true" is one load and "is literal false" is one load of the opposite index.
+
+@njit(cache=True, boundscheck=False)
+def lit_index(literal: int) -> int:
+    return (abs(literal) << 1) | (literal < 0)
+
+@njit(cache=True, boundscheck=False)
+def propagate_nb(
+    clauses_flat: np.ndarray,
+    clause_off: np.ndarray,
+    watch_head: np.ndarray,
+    watch_next: np.ndarray,
+    watch_clause: np.ndarray,
+    watch_map: np.ndarray,
+    assignment: np.ndarray,
+    lit_true: np.ndarray,
+    phase: np.ndarray,
+    decision_levels: np.ndarray,
+    reason: np.ndarray,
+    level_literals: np.ndarray,
+    level_count: int,
+    qhead: int,
+    decision_level: int,
+    num_vars: int,
+):
+    # The trail doubles as the propagation queue: level_literals[qhead:level_count] are
+    # assigned but their watches have not been visited yet.
+    while qhead < level_count:
+        opposite = -level_literals[qhead]
+        qhead += 1
+        head = opposite + num_vars
+        prev = -1
+        node = watch_head[head]
+        while node != -1:
+            following = watch_next[node]
+            clause_idx = watch_clause[node]
+            slot = node & 1
+            w1 = watch_map[clause_idx, 0]
+            w2 = watch_map[clause_idx, 1]
+            other = watch_map[clause_idx, 1 - slot]
+            other_idx = lit_index(other)
+            if lit_true[other_idx]:
+                prev = node
+                node = following
+                continue
+            found = False
+            for k in range(clause_off[clause_idx], clause_off[clause_idx + 1]):
+                candidate = clauses_flat[k]
+                if candidate == w1 or candidate == w2:
+                    continue
+                if lit_true[lit_index(candidate) ^ 1]:
+                    continue
+                watch_map[clause_idx, slot] = candidate
+                if prev < 0:
+                    watch_head[head] = following
+                else:
+                    watch_next[prev] = following
+                watch_next[node] = watch_head[candidate + num_vars]
+                watch_head[candidate + num_vars] = node
+                found = True
+                break
+            if found:
+                node = following
+                continue
+            if lit_true[other_idx ^ 1]:
+                return clause_idx, level_count, qhead
+            var = abs(other)
+            value = 1 if other > 0 else 0
+            assignment[var] = value
+            lit_true[other_idx] = 1
+            lit_true[other_idx ^ 1] = 0
+            phase[var] = value
+            decision_levels[var] = decision_level
+            reason[var] = clause_idx
+            level_literals[level_count] = other
+            level_count += 1
+            prev = node
+            node = following
+    return -1, level_count, qhead
+
+# Without numba, propagate_nb runs as plain Python and pays for numpy scalar indexing and a
+# lit_index call per literal. The specialized variant is generated per formula with num_vars
+# baked in, lit_index inlined, and every array accessed through a memoryview (plain ints).
+PROPAGATE_TEMPLATE = """
+def propagate_specialized(
+    clauses_flat, clause_off, watch_head, watch_next, watch_clause, watch_map, assignment,
+    lit_true, phase, decision_levels, reason, level_literals, level_count, qhead, decision_level, num_vars,
+):
+    clauses_flat = memoryview(clauses_flat)
+    clause_off = memoryview(clause_off)
+    watch_head = memoryview(watch_head)
+    watch_next = memoryview(watch_next)
+    watch_clause = memoryview(watch_clause)
+    watch_map = memoryview(watch_map.reshape(-1))
+    assignment = memoryview(assignment)
+    lit_true = memoryview(lit_true)
+    phase = memoryview(phase)
+    decision_levels = memoryview(decision_levels)
+    reason = memoryview(reason)
+    trail = memoryview(level_literals)
+    while qhead < level_count:
+        opposite = -trail[qhead]
+        qhead += 1
+        head = opposite + {num_vars}
+        prev = -1
+        node = watch_head[head]
+        while node != -1:
+            following = watch_next[node]
+            clause_idx = watch_clause[node]
+            base = clause_idx << 1
+            slot = node & 1
+            w1 = watch_map[base]
+            w2 = watch_map[base + 1]
+            other = w2 if slot == 0 else w1
+            other_idx = (other << 1) if other > 0 else ((-other) << 1) | 1
+            if lit_true[other_idx]:
+                prev = node
+                node = following
+                continue
+            for k in range(clause_off[clause_idx], clause_off[clause_idx + 1]):
+                candidate = clauses_flat[k]
+                if candidate == w1 or candidate == w2:
+                    continue
+                if lit_true[(candidate << 1) | 1 if candidate > 0 else (-candidate) << 1]:
+                    continue
+                watch_map[base + slot] = candidate
+                if prev < 0:
+                    watch_head[head] = following
+                else:
+                    watch_next[prev] = following
+                watch_next[node] = watch_head[candidate + {num_vars}]
+                watch_head[candidate + {num_vars}] = node
+                break
+            else:
+                if lit_true[other_idx ^ 1]:
+                    return clause_idx, level_count, qhead
+                var = other if other > 0 else -other
+                value = 1 if other > 0 else 0
+                assignment[var] = value
+                lit_true[other_idx] = 1
+                lit_true[other_idx ^ 1] = 0
+                phase[var] = value
+                decision_levels[var] = decision_level
+                reason[var] = clause_idx
+                trail[level_count] = other
+                level_count += 1
+                prev = node
+            node = following
+    return -1, level_count, qhead
+"""
+
+def specialize_propagate(num_vars: int):
+    namespace = {}
+    exec(PROPAGATE_TEMPLATE.format(num_vars=num_vars), namespace)
+    return namespace["propagate_specialized"]
+
+def propagate_kernel(num_vars: int):
+    # numba -> generated pure-Python specialization -> propagate_nb interpreted as-is.
+    if JIT_ENABLED:
+        return propagate_nb
+    try:
+        return specialize_propagate(num_vars)
+    except Exception:
+        return propagate_nb
@@ -0,0 +1,127 @@
+from __future__ import annotations
+import numpy as np
+from fabfive_sat.solvers._cdcl_core import lit_index, njit
+
+# JIT-compiled kernels for dpll_jw. assign[var] is -1 while unassigned, else 0/1. The watch list
+# of literal index i is watch_buf[watch_off[i]:watch_off[i] + watch_count[i]]; its capacity is the
+# literal's occurrence count, since a clause can only ever watch literals it contains.
+
+@njit(cache=True, boundscheck=False)
+def unit_propagate_nb(
+    lits: np.ndarray,
+    starts: np.ndarray,
+    watch_buf: np.ndarray,
+    watch_off: np.ndarray,
+    watch_count: np.ndarray,
+    assign: np.ndarray,
+    trail: np.ndarray,
+    trail_len: int,
+    qhead: int,
+):
+    units = 0
+    while qhead < trail_len:
+        false_lit = -trail[qhead]
+        qhead += 1
+        false_idx = lit_index(false_lit)
+        base = watch_off[false_idx]
+        end = base + watch_count[false_idx]
+        i = base
+        j = base
+        while i < end:
+            clause = watch_buf[i]
+            i += 1
+            start = starts[clause]
+            # Keep the falsified watch in slot 1 so slot 0 holds the other watch.
+            if lits[start] == false_lit:
+                lits[start] = lits[start + 1]
+                lits[start + 1] = false_lit
+            first = lits[start]
+            first_val = assign[abs(first)]
+            if first_val >= 0 and first_val == (1 if first > 0 else 0):
+                watch_buf[j] = clause
+                j += 1
+                continue
+            found = False
+            for k in range(start + 2, starts[clause + 1]):
+                lit = lits[k]
+                val = assign[abs(lit)]
+                if val < 0 or val == (1 if lit > 0 else 0):
+                    lits[start + 1] = lit
+                    lits[k] = false_lit
+                    idx = lit_index(lit)
+                    watch_buf[watch_off[idx] + watch_count[idx]] = clause
+                    watch_count[idx] += 1
+                    found = True
+                    break
+            if found:
+                continue
+            watch_buf[j] = clause
+            j += 1
+            if first_val >= 0:
+                while i < end:
+                    watch_buf[j] = watch_buf[i]
+                    i += 1
+                    j += 1
+                watch_count[false_idx] = j - base
+                return True, trail_len, qhead, units
+            assign[abs(first)] = 1 if first > 0 else 0
+            trail[trail_len] = first
+            trail_len += 1
+            units += 1
+        watch_count[false_idx] = j - base
+    return False, trail_len, qhead, units
+
+# sat_count[c] is the number of true literals of clause c. alive[i] and alive_weight[i] count,
+# and sum the JW weights of, the unsatisfied clauses containing literal index i; they change only
+# when a clause gains its first true literal or loses its last one, so the trail is replayed
+# forward on assignment and backward on backtracking.
+
+@njit(cache=True, boundscheck=False)
+def satisfy_nb(
+    lits: np.ndarray,
+    starts: np.ndarray,
+    occ: np.ndarray,
+    occ_off: np.ndarray,
+    weights: np.ndarray,
+    sat_count: np.ndarray,
+    alive: np.ndarray,
+    alive_weight: np.ndarray,
+    trail: np.ndarray,
+    begin: int,
+    end: int,
+) -> None:
+    for t in range(begin, end):
+        idx = lit_index(trail[t])
+        for i in range(occ_off[idx], occ_off[idx + 1]):
+            clause = occ[i]
+            sat_count[clause] += 1
+            if sat_count[clause] == 1:
+                for k in range(starts[clause], starts[clause + 1]):
+                    lit_idx = lit_index(lits[k])
+                    alive[lit_idx] -= 1
+                    alive_weight[lit_idx] -= weights[clause]
+
+@njit(cache=True, boundscheck=False)
+def unsatisfy_nb(
+    lits: np.ndarray,
+    starts: np.ndarray,
+    occ: np.ndarray,
+    occ_off: np.ndarray,
+    weights: np.ndarray,
+    sat_count: np.ndarray,
+    alive: np.ndarray,
+    alive_weight: np.ndarray,
+    trail: np.ndarray,
+    begin: int,
+    end: int,
+) -> None:
+    for t in range(end - 1, begin - 1, -1):
+        idx = lit_index(trail[t])
+        for i in range(occ_off[idx], occ_off[idx + 1]):
+            clause = occ[i]
+            sat_count[clause] -= 1
+            if sat_count[clause] == 0:
+                for k in range(starts[clause], starts[clause + 1]):
+                    lit_idx = lit_index(lits[k])
+                    alive[lit_idx] += 1
+                    alive_weight[lit_idx] += weights[clause]
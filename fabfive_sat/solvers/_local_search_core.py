@@ -0,0 +1,173 @@
+from __future__ import annotations
+import numpy as np
+from fabfive_sat.solvers._cdcl_core import njit
+
+# Kernels shared by walksat and probsat over the CSR form from utils.cnf_flatten.
+# assign[var] is 0/1 and sat_count[c] is the number of true literals of clause c; flip_nb keeps
+# it current in O(occurrences of var). For a variable, (var << 1) | (1 - assign[var]) is the
+# occurrence-list index of its currently true literal and xor 1 gives the false one.
+# The unsatisfied clauses are unsat[:num_unsat] with unsat_pos[c] the slot of clause c (-1 when
+# satisfied); the flip kernels keep both current by append and swap-remove and return num_unsat.
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def count_true_nb(lits: np.ndarray, starts: np.ndarray, assign: np.ndarray, sat_count: np.ndarray) -> None:
+    for clause in range(len(starts) - 1):
+        count = 0
+        for k in range(starts[clause], starts[clause + 1]):
+            lit = lits[k]
+            if assign[abs(lit)] == (1 if lit > 0 else 0):
+                count += 1
+        sat_count[clause] = count
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def collect_unsat_nb(sat_count: np.ndarray, unsat: np.ndarray, unsat_pos: np.ndarray) -> int:
+    num_unsat = 0
+    for clause in range(len(sat_count)):
+        if sat_count[clause] == 0:
+            unsat[num_unsat] = clause
+            unsat_pos[clause] = num_unsat
+            num_unsat += 1
+        else:
+            unsat_pos[clause] = -1
+    return num_unsat
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def unsat_add(unsat: np.ndarray, unsat_pos: np.ndarray, num_unsat: int, clause: int) -> int:
+    unsat[num_unsat] = clause
+    unsat_pos[clause] = num_unsat
+    return num_unsat + 1
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def unsat_remove(unsat: np.ndarray, unsat_pos: np.ndarray, num_unsat: int, clause: int) -> int:
+    num_unsat -= 1
+    slot = unsat_pos[clause]
+    last = unsat[num_unsat]
+    unsat[slot] = last
+    unsat_pos[last] = slot
+    unsat_pos[clause] = -1
+    return num_unsat
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def flip_nb(
+    occ: np.ndarray,
+    occ_off: np.ndarray,
+    assign: np.ndarray,
+    sat_count: np.ndarray,
+    unsat: np.ndarray,
+    unsat_pos: np.ndarray,
+    num_unsat: int,
+    var: int,
+) -> int:
+    true_idx = (var << 1) | (1 - assign[var])
+    assign[var] = 1 - assign[var]
+    for i in range(occ_off[true_idx], occ_off[true_idx + 1]):
+        clause = occ[i]
+        sat_count[clause] -= 1
+        if sat_count[clause] == 0:
+            num_unsat = unsat_add(unsat, unsat_pos, num_unsat, clause)
+    for i in range(occ_off[true_idx ^ 1], occ_off[(true_idx ^ 1) + 1]):
+        clause = occ[i]
+        sat_count[clause] += 1
+        if sat_count[clause] == 1:
+            num_unsat = unsat_remove(unsat, unsat_pos, num_unsat, clause)
+    return num_unsat
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def flip_scores_nb(
+    lits: np.ndarray,
+    starts: np.ndarray,
+    occ: np.ndarray,
+    occ_off: np.ndarray,
+    assign: np.ndarray,
+    sat_count: np.ndarray,
+    clause: int,
+    scores: np.ndarray,
+) -> None:
+    # scores[i]: change in the number of unsatisfied clauses if the i-th variable of clause flips.
+    for k in range(starts[clause], starts[clause + 1]):
+        var = abs(lits[k])
+        true_idx = (var << 1) | (1 - assign[var])
+        delta = 0
+        for i in range(occ_off[true_idx], occ_off[true_idx + 1]):
+            if sat_count[occ[i]] == 1:
+                delta += 1
+        for i in range(occ_off[true_idx ^ 1], occ_off[(true_idx ^ 1) + 1]):
+            if sat_count[occ[i]] == 0:
+                delta -= 1
+        scores[k - starts[clause]] = delta
+
+# Walksat additionally keeps per-variable make/break counts. crit_sum[c] is the sum of the
+# variables with a true literal in c, so it names the sole satisfying variable when
+# sat_count[c] == 1; break_count[v] counts clauses where v is that variable and make_count[v]
+# counts unsatisfied clauses containing v.
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def init_counts_nb(
+    lits: np.ndarray,
+    starts: np.ndarray,
+    assign: np.ndarray,
+    sat_count: np.ndarray,
+    crit_sum: np.ndarray,
+    break_count: np.ndarray,
+    make_count: np.ndarray,
+) -> None:
+    break_count[:] = 0
+    make_count[:] = 0
+    for clause in range(len(starts) - 1):
+        count = 0
+        total = 0
+        for k in range(starts[clause], starts[clause + 1]):
+            lit = lits[k]
+            if assign[abs(lit)] == (1 if lit > 0 else 0):
+                count += 1
+                total += abs(lit)
+        sat_count[clause] = count
+        crit_sum[clause] = total
+        if count == 1:
+            break_count[total] += 1
+        elif count == 0:
+            for k in range(starts[clause], starts[clause + 1]):
+                make_count[abs(lits[k])] += 1
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def flip_counts_nb(
+    lits: np.ndarray,
+    starts: np.ndarray,
+    occ: np.ndarray,
+    occ_off: np.ndarray,
+    assign: np.ndarray,
+    sat_count: np.ndarray,
+    crit_sum: np.ndarray,
+    break_count: np.ndarray,
+    make_count: np.ndarray,
+    unsat: np.ndarray,
+    unsat_pos: np.ndarray,
+    num_unsat: int,
+    var: int,
+) -> int:
+    true_idx = (var << 1) | (1 - assign[var])
+    assign[var] = 1 - assign[var]
+    for i in range(occ_off[true_idx], occ_off[true_idx + 1]):
+        clause = occ[i]
+        sat_count[clause] -= 1
+        crit_sum[clause] -= var
+        if sat_count[clause] == 0:
+            break_count[var] -= 1
+            num_unsat = unsat_add(unsat, unsat_pos, num_unsat, clause)
+            for k in range(starts[clause], starts[clause + 1]):
+                make_count[abs(lits[k])] += 1
+        elif sat_count[clause] == 1:
+            break_count[crit_sum[clause]] += 1
+    false_idx = true_idx ^ 1
+    for i in range(occ_off[false_idx], occ_off[false_idx + 1]):
+        clause = occ[i]
+        sat_count[clause] += 1
+        crit_sum[clause] += var
+        if sat_count[clause] == 1:
+            break_count[var] += 1
+            num_unsat = unsat_remove(unsat, unsat_pos, num_unsat, clause)
+            for k in range(starts[clause], starts[clause + 1]):
+                make_count[abs(lits[k])] -= 1
+        elif sat_count[clause] == 2:
+            break_count[crit_sum[clause] - var] -= 1
+    return num_unsat
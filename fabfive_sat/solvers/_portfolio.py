@@ -0,0 +1,48 @@
+from __future__ import annotations
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+
+# Independent local-search restarts run as a process portfolio. The formula reaches each worker
+# once through the pool initializer, so a task is only a seed; the shared event tells restarts
+# still in flight to give up as soon as one of them has found a model.
+
+WORKER_STATE: Dict[str, object] = {}
+
+def init_worker(restart: Callable, args: tuple, stop) -> None:
+    WORKER_STATE.update(restart=restart, args=args, stop=stop)
+
+def run_restart(seed: int) -> Tuple[Optional[np.ndarray], int]:
+    return WORKER_STATE["restart"](seed, WORKER_STATE["stop"], *WORKER_STATE["args"])
+
+def run_portfolio(restart: Callable, args: tuple, seeds: List[int], workers: int) -> Tuple[Optional[np.ndarray], int, int]:
+    context = multiprocessing.get_context()
+    stop = context.Event()
+    found = None
+    flips = 0
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=init_worker, initargs=(restart, args, stop)) as pool:
+        pending = {pool.submit(run_restart, seed) for seed in seeds}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    assignment, restart_flips = future.result()
+                    flips += restart_flips
+                    if found is not None:
+                        continue
+                    if assignment is None:
+                        failed += 1
+                        continue
+                    found = assignment
+                    stop.set()
+                    for other in pending:
+                        other.cancel()
+        finally:
+            stop.set()
+            for other in pending:
+                other.cancel()
+    return found, flips, failed
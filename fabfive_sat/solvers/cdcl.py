@@ -0,0 +1,491 @@
+from __future__ import annotations
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from itertools import chain
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+from fabfive_sat.utils.cnf_parser import CNFFormula, load_formula
+from fabfive_sat.utils.assignment_bits import encode_assignment
+from fabfive_sat.solvers._cdcl_core import lit_index, propagate_kernel
+Clause = List[int]
+Formula = List[Clause]
+DEADLINE_INTERVAL = 1024
+
+@dataclass
+class SolverStats:
+    decisions: int = 0
+    conflicts: int = 0
+    learned_clauses: int = 0
+    restarts: int = 0
+# CDCL (Conflict-Driven Clause Learning)
+# Decision
+# Unit Propagation
+# 1 UIP Conflict-> implication graph-> learned clause
+# Non-Chronological Backtracking
+# VSIDS (Variable State Independent Decaying Sum)
+
+class IndexedHeap:
+    # MiniSat-style max-heap over variable activity; pos[var] is the heap slot of var or -1.
+    def __init__(self, num_vars: int) -> None:
+        self.heap = np.zeros(num_vars, dtype=np.int32)
+        self.pos = np.full(num_vars + 1, -1, dtype=np.int32)
+        self.activity = np.zeros(num_vars + 1, dtype=np.float64)
+        self.size = 0
+        self.var_inc = 1.0
+
+    def push(self, var: int) -> None:
+        if self.pos[var] >= 0:
+            return
+        self.heap[self.size] = var
+        self.pos[var] = self.size
+        self.size += 1
+        self.sift_up(self.size - 1)
+
+    def pop(self, assignment: np.ndarray) -> Optional[int]:
+        while self.size:
+            var = int(self.heap[0])
+            self.size -= 1
+            self.pos[var] = -1
+            if self.size:
+                last = int(self.heap[self.size])
+                self.heap[0] = last
+                self.pos[last] = 0
+                self.sift_down(0)
+            if assignment[var] < 0:
+                return var
+        return None
+
+    def update(self, var: int) -> None:
+        if self.pos[var] >= 0:
+            self.sift_up(int(self.pos[var]))
+
+    def bump(self, var: int) -> None:
+        self.activity[var] += self.var_inc
+        if self.activity[var] > 1e100:
+            self.activity *= 1e-100
+            self.var_inc *= 1e-100
+        self.update(var)
+
+    def decay(self, factor: float) -> None:
+        self.var_inc /= factor
+
+    def sift_up(self, i: int) -> None:
+        heap, pos, activity = self.heap, self.pos, self.activity
+        var = int(heap[i])
+        score = activity[var]
+        while i > 0:
+            parent = (i - 1) >> 1
+            parent_var = int(heap[parent])
+            if activity[parent_var] >= score:
+                break
+            heap[i] = parent_var
+            pos[parent_var] = i
+            i = parent
+        heap[i] = var
+        pos[var] = i
+
+    def sift_down(self, i: int) -> None:
+        heap, pos, activity = self.heap, self.pos, self.activity
+        var = int(heap[i])
+        score = activity[var]
+        while True:
+            child = 2 * i + 1
+            if child >= self.size:
+                break
+            if child + 1 < self.size and activity[heap[child + 1]] > activity[heap[child]]:
+                child += 1
+            child_var = int(heap[child])
+            if activity[child_var] <= score:
+                break
+            heap[i] = child_var
+            pos[child_var] = i
+            i = child
+        heap[i] = var
+        pos[var] = i
+
+@dataclass
+class SolverState:
+    num_vars: int
+    clauses_flat: np.ndarray
+    clause_off: np.ndarray
+    num_clauses: int
+    assignment: np.ndarray
+    lit_true: np.ndarray
+    decision_levels: np.ndarray
+    reason: np.ndarray
+    level_literals: np.ndarray
+    seen: bytearray
+    watch_head: np.ndarray
+    watch_next: np.ndarray
+    watch_clause: np.ndarray
+    watch_map: np.ndarray
+    queue: IndexedHeap
+    phase: np.ndarray
+    propagate_fn: Callable
+    level_count: int = 0
+    qhead: int = 0
+    decision_level: int = 0
+    decay: float = 0.95
+    num_original: int = 0
+    learned_lbd: List[int] = field(default_factory=list)
+
+# Clause database is stored SoA: literals of clause i live in
+# clauses_flat[clause_off[i]:clause_off[i + 1]], and watch_map[i] holds its two watched literals.
+# Watches are intrusive singly-linked lists per literal: watch_head[lit + num_vars] is the first
+# node, watch_next[node] the next one; node 2 * i + slot watches watch_map[i, slot] of clause i.
+
+def grow(array: np.ndarray, needed: int) -> np.ndarray:
+    if needed <= len(array):
+        return array
+    capacity = max(needed, 2 * len(array))
+    grown = np.full((capacity,) + array.shape[1:], -1, dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+def clause_literals(state: SolverState, clause_idx: int) -> List[int]:
+    return state.clauses_flat[state.clause_off[clause_idx] : state.clause_off[clause_idx + 1]].tolist()
+
+def add_clause(state: SolverState, clause: List[int]) -> int:
+    idx = state.num_clauses
+    start = int(state.clause_off[idx])
+    state.clauses_flat = grow(state.clauses_flat, start + len(clause))
+    state.clause_off = grow(state.clause_off, idx + 2)
+    state.watch_map = grow(state.watch_map, idx + 1)
+    state.watch_next = grow(state.watch_next, 2 * idx + 2)
+    state.watch_clause = grow(state.watch_clause, 2 * idx + 2)
+    state.clauses_flat[start : start + len(clause)] = clause
+    state.clause_off[idx + 1] = start + len(clause)
+    state.num_clauses += 1
+    if len(clause) == 1:
+        state.watch_map[idx] = (clause[0], clause[0])
+        add_watch(state, clause[0], 2 * idx)
+    else:
+        state.watch_map[idx] = (clause[0], clause[1])
+        add_watch(state, clause[0], 2 * idx)
+        add_watch(state, clause[1], 2 * idx + 1)
+    return idx
+
+def rebuild_watches(state: SolverState) -> None:
+    count = state.num_clauses
+    lengths = np.diff(state.clause_off[: count + 1])
+    live = np.ones(2 * count, dtype=bool)
+    live[1::2] = lengths > 1
+    nodes = np.flatnonzero(live).astype(np.int32)
+    keys = state.watch_map[:count].ravel()[live] + state.num_vars
+    order = np.argsort(keys, kind="stable")
+    nodes, keys = nodes[order], keys[order]
+    state.watch_head.fill(-1)
+    state.watch_next.fill(-1)
+    state.watch_clause.fill(-1)
+    state.watch_clause[nodes] = nodes >> 1
+    same = keys[1:] == keys[:-1]
+    state.watch_next[nodes[:-1][same]] = nodes[1:][same]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = ~same
+    state.watch_head[keys[first]] = nodes[first]
+
+def initialize_state(formula: Formula, num_vars: int = 0) -> SolverState:
+    num_clauses = len(formula)
+    lengths = np.fromiter(map(len, formula), dtype=np.int32, count=num_clauses)
+    num_lits = int(lengths.sum())
+    lits = np.fromiter(chain.from_iterable(formula), dtype=np.int32, count=num_lits)
+    num_vars = max(num_vars, int(np.abs(lits).max(initial=0)))
+    # Reserve as much room again for learned clauses before the arrays need to grow.
+    clause_cap = 2 * num_clauses + 1
+    state = SolverState(
+        num_vars=num_vars,
+        clauses_flat=np.zeros(2 * num_lits + 1, dtype=np.int32),
+        clause_off=np.zeros(clause_cap + 1, dtype=np.int32),
+        num_clauses=num_clauses,
+        assignment=np.full(num_vars + 1, -1, dtype=np.int8),
+        lit_true=np.zeros(2 * num_vars + 2, dtype=np.int8),
+        decision_levels=np.full(num_vars + 1, -1, dtype=np.int32),
+        reason=np.full(num_vars + 1, -1, dtype=np.int32),
+        level_literals=np.zeros(num_vars + 1, dtype=np.int32),
+        seen=bytearray(num_vars + 1),
+        watch_head=np.full(2 * num_vars + 1, -1, dtype=np.int32),
+        watch_next=np.full(2 * clause_cap, -1, dtype=np.int32),
+        watch_clause=np.full(2 * clause_cap, -1, dtype=np.int32),
+        watch_map=np.zeros((clause_cap, 2), dtype=np.int32),
+        queue=IndexedHeap(num_vars),
+        phase=np.ones(num_vars + 1, dtype=np.int8),
+        propagate_fn=propagate_kernel(num_vars),
+    )
+    state.clauses_flat[:num_lits] = lits
+    np.cumsum(lengths, out=state.clause_off[1 : num_clauses + 1])
+    starts = state.clause_off[:num_clauses]
+    state.watch_map[:num_clauses, 0] = lits[starts]
+    state.watch_map[:num_clauses, 1] = lits[starts + (lengths > 1)]
+    state.num_original = num_clauses
+    rebuild_watches(state)
+    occurrences = np.bincount(np.abs(lits), minlength=num_vars + 1)
+    state.queue.activity[:] = occurrences
+    for var in np.flatnonzero(occurrences).tolist():
+        state.queue.push(var)
+    return state
+
+def value_of(literal: int, assignment: np.ndarray) -> Optional[bool]:
+    val = assignment[abs(literal)]
+    return None if val < 0 else bool(val ^ (literal < 0))
+
+def add_watch(state: SolverState, literal: int, node: int) -> None:
+    head = literal + state.num_vars
+    state.watch_clause[node] = node >> 1
+    state.watch_next[node] = state.watch_head[head]
+    state.watch_head[head] = node
+
+def assign(state: SolverState, literal: int, reason: int) -> None:
+    var = abs(literal)
+    idx = lit_index(literal)
+    state.assignment[var] = literal > 0
+    state.lit_true[idx] = 1
+    state.lit_true[idx ^ 1] = 0
+    state.phase[var] = literal > 0
+    state.decision_levels[var] = state.decision_level
+    state.reason[var] = reason
+    state.level_literals[state.level_count] = literal
+    state.level_count += 1
+
+def propagate(state: SolverState, stats: SolverStats) -> Optional[int]:
+    conflict, state.level_count, state.qhead = state.propagate_fn(
+        state.clauses_flat,
+        state.clause_off,
+        state.watch_head,
+        state.watch_next,
+        state.watch_clause,
+        state.watch_map,
+        state.assignment,
+        state.lit_true,
+        state.phase,
+        state.decision_levels,
+        state.reason,
+        state.level_literals,
+        state.level_count,
+        state.qhead,
+        state.decision_level,
+        state.num_vars,
+    )
+    if conflict < 0:
+        return None
+    stats.conflicts += 1
+    return int(conflict)
+
+def analyze_conflict(state: SolverState, conflict: int) -> Tuple[List[int], int, int]:
+    seen = state.seen
+    levels = state.decision_levels
+    trail = state.level_literals
+    learned: List[int] = [0]
+    counter = 0
+    pivot = 0
+    index = state.level_count - 1
+    clause_idx = conflict
+    while True:
+        for lit in clause_literals(state, clause_idx):
+            var = abs(lit)
+            if var == pivot or seen[var] or levels[var] <= 0:
+                continue
+            seen[var] = 1
+            if levels[var] >= state.decision_level:
+                counter += 1
+            else:
+                learned.append(lit)
+        while not seen[abs(int(trail[index]))]:
+            index -= 1
+        uip = int(trail[index])
+        index -= 1
+        pivot = abs(uip)
+        seen[pivot] = 0
+        counter -= 1
+        if counter == 0:
+            break
+        clause_idx = int(state.reason[pivot])
+    learned[0] = -uip
+    for lit in learned[1:]:
+        seen[abs(lit)] = 0
+
+    backjump = 0
+    for i in range(1, len(learned)):
+        lvl = int(levels[abs(learned[i])])
+        if lvl > backjump:
+            backjump = lvl
+            learned[1], learned[i] = learned[i], learned[1]
+    lbd = len({int(levels[abs(lit)]) for lit in learned})
+    return learned, backjump, lbd
+
+def backtrack(state: SolverState, level: int) -> None:
+    trail = state.level_literals
+    levels = state.decision_levels
+    count = state.level_count
+    while count and levels[abs(trail[count - 1])] > level:
+        count -= 1
+        var = abs(int(trail[count]))
+        state.assignment[var] = -1
+        state.lit_true[2 * var : 2 * var + 2] = 0
+        levels[var] = -1
+        state.reason[var] = -1
+        state.queue.push(var)
+    state.level_count = count
+    state.qhead = min(state.qhead, count)
+    state.decision_level = level
+
+def learn_clause(state: SolverState, clause: List[int], lbd: int, stats: SolverStats) -> int:
+    idx = add_clause(state, clause)
+    state.learned_lbd.append(lbd)
+    stats.learned_clauses += 1
+    for lit in clause:
+        var = abs(lit)
+        state.queue.bump(var)
+    return idx
+
+def reduce_db(state: SolverState) -> None:
+    # Drop the half of the learned clauses with the highest LBD, sparing those that are reasons.
+    count = state.num_clauses
+    first = state.num_original
+    assigned = state.assignment >= 0
+    reasons = state.reason[assigned]
+    locked = np.zeros(count, dtype=bool)
+    locked[reasons[reasons >= 0]] = True
+    lbd = np.asarray(state.learned_lbd, dtype=np.int32)
+    order = np.argsort(-lbd, kind="stable") + first
+    victims = order[~locked[order]][: len(lbd) // 2]
+    if not len(victims):
+        return
+    keep = np.ones(count, dtype=bool)
+    keep[victims] = False
+    off = state.clause_off
+    lengths = np.diff(off[: count + 1])
+    kept = int(keep.sum())
+    flat = state.clauses_flat[: off[count]][np.repeat(keep, lengths)]
+    state.clauses_flat[: len(flat)] = flat
+    np.cumsum(lengths[keep], out=off[1 : kept + 1])
+    state.watch_map[:kept] = state.watch_map[:count][keep]
+    remap = np.cumsum(keep, dtype=np.int32) - 1
+    state.reason[assigned] = np.where(reasons >= 0, remap[reasons], -1)
+    state.learned_lbd = lbd[keep[first:]].tolist()
+    state.num_clauses = kept
+    rebuild_watches(state)
+
+def decay_scores(state: SolverState) -> None:
+    state.queue.decay(state.decay)
+
+def select_branch_literal(state: SolverState) -> Optional[int]:
+    var = state.queue.pop(state.assignment)
+    if var is None:
+        return None
+    sign = state.phase[var] != 0
+    return var if sign else -var
+
+def cdcl(state: SolverState, stats: SolverStats, deadline: Optional[float] = None) -> bool:
+    restart_limit = 100
+    restart_multiplier = 1.5
+    conflicts_since_restart = 0
+    reduce_limit = 2000
+    conflicts_since_reduce = 0
+    conflicts_until_check = DEADLINE_INTERVAL
+
+    while True:
+        conflict = propagate(state, stats)
+        if conflict is not None:
+            stats.conflicts += 1
+            conflicts_since_restart += 1
+            conflicts_since_reduce += 1
+            if state.decision_level == 0:
+                return False
+            clause, backjump, lbd = analyze_conflict(state, conflict)
+            clause_idx = learn_clause(state, clause, lbd, stats)
+            backtrack(state, backjump)
+            decay_scores(state)
+            assign(state, clause[0], clause_idx)
+
+            conflicts_until_check -= 1
+            if conflicts_until_check == 0:
+                conflicts_until_check = DEADLINE_INTERVAL
+                if deadline is not None and time.monotonic() > deadline:
+                    raise TimeoutError()
+
+            if conflicts_since_reduce >= reduce_limit:
+                reduce_db(state)
+                conflicts_since_reduce = 0
+                reduce_limit += 300
+            
+            if conflicts_since_restart >= restart_limit:
+                stats.restarts += 1
+                backtrack(state, 0)
+                conflicts_since_restart = 0
+                restart_limit = int(restart_limit * restart_multiplier)
+            
+            continue
+        literal = select_branch_literal(state)
+        if literal is None:
+            return True
+        state.decision_level += 1
+        stats.decisions += 1
+        assign(state, literal, -1)
+
+def run_solver(cnf: Path | CNFFormula, deadline: Optional[float] = None) -> Dict[str, object]:
+    cnf = load_formula(cnf)
+    state = initialize_state(cnf.clauses, cnf.num_vars)
+    stats = SolverStats()
+    
+    for clause in cnf.clauses:
+        if len(clause) == 1:
+            lit = clause[0]
+            val = value_of(lit, state.assignment)
+            if val is not None:
+                if not val:
+                    return {
+                        "solver": "cdcl",
+                        "status": "UNSAT",
+                        "decisions": 0,
+                        "conflicts": 0,
+                        "learned_clauses": 0,
+                        "restarts": 0,
+                        "num_clauses": state.num_clauses,
+                    }
+            else:
+                assign(state, lit, -1)
+    
+    if propagate(state, stats) is not None:
+         return {
+            "solver": "cdcl",
+            "status": "UNSAT",
+            "decisions": 0,
+            "conflicts": 0,
+            "learned_clauses": 0,
+            "restarts": 0,
+            "num_clauses": state.num_clauses,
+        }
+
+    sat = cdcl(state, stats, deadline)
+    result = {
+        "solver": "cdcl",
+        "status": "SAT" if sat else "UNSAT",
+        "decisions": stats.decisions,
+        "conflicts": stats.conflicts,
+        "learned_clauses": stats.learned_clauses,
+        "restarts": stats.restarts,
+        "num_clauses": state.num_clauses,
+    }
+    if sat:
+        result["assignment_bits"] = encode_assignment(state.assignment)
+    return result
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cnf", required=True)
+    args = parser.parse_args()
+    start = time.perf_counter()
+    result = run_solver(Path(args.cnf))
+    result["wall_time"] = time.perf_counter() - start
+    print(json.dumps(result))
+
+if __name__ == "__main__":
+    main()
+
+# o(2^n) in the worst case (since SAT is NP-Complete)
\ No newline at end of file
@@ -0,0 +1,153 @@
+from __future__ import annotations
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+from fabfive_sat.utils.cnf_parser import CNFFormula, load_formula
+Clause = List[int]
+MaskedClause = Tuple[int, int, Clause]
+Masks = Tuple[int, int]
+
+@dataclass
+class SolverStats:
+    decisions: int = 0
+    unit_propagations: int = 0
+    pure_eliminations: int = 0
+
+# Each clause is carried as (pos, neg, literals) where pos/neg are bitmasks of its positive and
+# negative variables, and the assignment as (true_mask, false_mask), so satisfaction and
+# "undecided literals" are single AND/OR tests instead of per-literal lookups.
+
+def clause_masks(clause: Clause) -> MaskedClause:
+    pos = neg = 0
+    for lit in clause:
+        if lit > 0:
+            pos |= 1 << lit
+        else:
+            neg |= 1 << -lit
+    return pos, neg, clause
+
+def assign_literal(clauses: List[MaskedClause], masks: Masks, literal: int) -> Tuple[List[MaskedClause], Masks, bool]:
+    true_mask, false_mask = masks
+    bit = 1 << abs(literal)
+    if literal > 0:
+        true_mask |= bit
+    else:
+        false_mask |= bit
+    unassigned = ~(true_mask | false_mask)
+    negated = -literal
+    updated: List[MaskedClause] = []
+    # Only clauses containing -literal can become falsified; the mask test is paid just by those.
+    for clause in clauses:
+        lits = clause[2]
+        if literal in lits:
+            continue
+        if negated in lits and not (clause[0] | clause[1]) & unassigned:
+            return clauses, masks, True
+        updated.append(clause)
+    return updated, (true_mask, false_mask), False
+
+def unit_propagate(clauses: List[MaskedClause], masks: Masks, stats: SolverStats) -> Tuple[List[MaskedClause], Masks, bool]:
+    current = clauses
+    while True:
+        unassigned = ~(masks[0] | masks[1])
+        unit_literal = 0
+        for pos, neg, _ in current:
+            undecided = (pos | neg) & unassigned
+            if not undecided:
+                return current, masks, True
+            if not undecided & (undecided - 1):
+                var = undecided.bit_length() - 1
+                unit_literal = var if pos & undecided else -var
+                break
+        if not unit_literal:
+            return current, masks, False
+        stats.unit_propagations += 1
+        current, masks, conflict = assign_literal(current, masks, unit_literal)
+        if conflict:
+            return current, masks, True
+
+def pure_literal_elimination(clauses: List[MaskedClause], masks: Masks, stats: SolverStats) -> Tuple[List[MaskedClause], Masks]:
+    true_mask, false_mask = masks
+    seen_pos = seen_neg = 0
+    for pos, neg, _ in clauses:
+        seen_pos |= pos
+        seen_neg |= neg
+    unassigned = ~(true_mask | false_mask)
+    seen_pos &= unassigned
+    seen_neg &= unassigned
+    pure_pos = seen_pos & ~seen_neg
+    pure_neg = seen_neg & ~seen_pos
+    if not pure_pos | pure_neg:
+        return clauses, masks
+    stats.pure_eliminations += pure_pos.bit_count() + pure_neg.bit_count()
+    remaining = [clause for clause in clauses if not (clause[0] & pure_pos) | (clause[1] & pure_neg)]
+    return remaining, (true_mask | pure_pos, false_mask | pure_neg)
+
+def pick_literal(clauses: List[MaskedClause], masks: Masks) -> int:
+    assigned = masks[0] | masks[1]
+    for lit in clauses[0][2]:
+        if not assigned >> abs(lit) & 1:
+            return lit
+    return clauses[0][2][0]
+
+def dpll(clauses: List[MaskedClause], masks: Masks, stats: SolverStats, deadline: Optional[float] = None) -> Tuple[bool, Masks]:
+    if deadline is not None and time.monotonic() > deadline:
+        raise TimeoutError()
+    current, masks, conflict = unit_propagate(clauses, masks, stats)
+    if conflict:
+        return False, masks
+    current, masks = pure_literal_elimination(current, masks, stats)
+    if not current:
+        return True, masks
+    var = abs(pick_literal(current, masks))
+    for value in (True, False):
+        stats.decisions += 1
+        new_clauses, trial_masks, branch_conflict = assign_literal(current, masks, var if value else -var)
+        if branch_conflict:
+            continue
+        result, final_masks = dpll(new_clauses, trial_masks, stats, deadline)
+        if result:
+            return True, final_masks
+    return False, masks
+
+def export_assignment(masks: Masks, num_vars: int) -> str:
+    # Bit var of true_mask becomes character var - 1; variables left unassigned read as false.
+    return format(masks[0] >> 1, f"0{num_vars}b")[::-1][:num_vars]
+
+def run_solver(cnf: Path | CNFFormula, deadline: Optional[float] = None) -> Dict[str, object]:
+    formula = load_formula(cnf)
+    stats = SolverStats()
+    # A clause holding both x and -x is always satisfied, and its masks would pass for a unit clause.
+    clauses = [masked for masked in map(clause_masks, formula.clauses) if not masked[0] & masked[1]]
+    sat, masks = dpll(clauses, (0, 0), stats, deadline)
+    result = {
+        "solver": "dpll_baseline",
+        "status": "SAT" if sat else "UNSAT",
+        "decisions": stats.decisions,
+        "unit_propagations": stats.unit_propagations,
+        "pure_eliminations": stats.pure_eliminations,
+        "num_vars": formula.num_vars,
+        "num_clauses": formula.num_clauses,
+    }
+    if sat:
+        num_vars = max([formula.num_vars] + [abs(lit) for clause in formula.clauses for lit in clause])
+        result["assignment_bits"] = export_assignment(masks, num_vars)
+    return result
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cnf", required=True)
+    args = parser.parse_args()
+    start = time.perf_counter()
+    result = run_solver(Path(args.cnf))
+    result["wall_time"] = time.perf_counter() - start
+    print(json.dumps(result))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+from __future__ import annotations
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+from fabfive_sat.utils.cnf_parser import CNFFormula, load_formula
+from fabfive_sat.utils.cnf_flatten import flatten_cnf, literal_index
+from fabfive_sat.utils.assignment_bits import encode_assignment
+from fabfive_sat.solvers._dpll_core import satisfy_nb, unit_propagate_nb, unsatisfy_nb
+Clause = List[int]
+Formula = List[Clause]
+
+@dataclass
+class SolverStats:
+    decisions: int = 0
+    unit_propagations: int = 0
+    pure_eliminations: int = 0
+
+@dataclass
+class SolverState:
+    num_vars: int
+    lits: np.ndarray
+    starts: np.ndarray
+    weights: np.ndarray
+    occ: np.ndarray
+    watch_buf: np.ndarray
+    watch_off: np.ndarray
+    watch_count: np.ndarray
+    assignment: np.ndarray
+    trail: np.ndarray
+    sat_count: np.ndarray
+    alive: np.ndarray
+    alive_weight: np.ndarray
+    trail_lim: List[int]
+    trail_len: int = 0
+    qhead: int = 0
+    applied: int = 0
+
+# Clause c occupies lits[starts[c]:starts[c + 1]] and is watched by its first two literals.
+# assignment[var] is -1 while unassigned, else 0/1; the trail records assignment order so
+# backtracking is truncation back to trail_lim[level]. The occurrence lists share watch_off with
+# the watch buffer, and trail[:applied] is already reflected in sat_count/alive/alive_weight.
+
+def initialize_state(clauses: Formula, num_vars: int) -> SolverState:
+    lits, starts, occurrences, watch_off = flatten_cnf(clauses, num_vars)
+    num_vars = (len(watch_off) - 3) // 2
+    lengths = np.diff(starts)
+    multi = np.flatnonzero(lengths > 1).astype(np.int32)
+    watched = np.concatenate((multi, multi))
+    keys = literal_index(lits[np.concatenate((starts[multi], starts[multi] + 1))])
+    order = np.argsort(keys, kind="stable")
+    keys, watched = keys[order], watched[order]
+    watch_count = np.bincount(keys, minlength=2 * num_vars + 2).astype(np.int32)
+    rank = np.arange(len(keys)) - (np.cumsum(watch_count) - watch_count)[keys]
+    watch_buf = np.empty_like(occurrences)
+    watch_buf[watch_off[keys] + rank] = watched
+    weights = np.ldexp(1.0, -lengths)
+    lit_keys = literal_index(lits)
+    return SolverState(
+        num_vars=num_vars,
+        lits=lits,
+        starts=starts,
+        weights=weights,
+        occ=occurrences,
+        watch_buf=watch_buf,
+        watch_off=watch_off,
+        watch_count=watch_count,
+        assignment=np.full(num_vars + 1, -1, dtype=np.int8),
+        trail=np.zeros(num_vars + 1, dtype=np.int32),
+        sat_count=np.zeros(len(lengths), dtype=np.int32),
+        alive=np.bincount(lit_keys, minlength=2 * num_vars + 2).astype(np.int32),
+        alive_weight=np.bincount(lit_keys, weights=np.repeat(weights, lengths), minlength=2 * num_vars + 2),
+        trail_lim=[],
+    )
+
+def lit_value(state: SolverState, literal: int) -> Optional[bool]:
+    val = int(state.assignment[abs(literal)])
+    return None if val < 0 else val == (literal > 0)
+
+def assign(state: SolverState, literal: int) -> None:
+    state.assignment[abs(literal)] = literal > 0
+    state.trail[state.trail_len] = literal
+    state.trail_len += 1
+
+def counter_args(state: SolverState) -> tuple:
+    return (state.lits, state.starts, state.occ, state.watch_off, state.weights, state.sat_count, state.alive, state.alive_weight, state.trail)
+
+def backtrack(state: SolverState, level: int) -> None:
+    target = state.trail_lim[level]
+    if state.applied > target:
+        unsatisfy_nb(*counter_args(state), target, state.applied)
+        state.applied = target
+    state.assignment[np.abs(state.trail[target : state.trail_len])] = -1
+    del state.trail_lim[level:]
+    state.trail_len = state.qhead = target
+
+def propagate(state: SolverState, stats: SolverStats) -> bool:
+    conflict, state.trail_len, state.qhead, units = unit_propagate_nb(
+        state.lits,
+        state.starts,
+        state.watch_buf,
+        state.watch_off,
+        state.watch_count,
+        state.assignment,
+        state.trail,
+        state.trail_len,
+        state.qhead,
+    )
+    stats.unit_propagations += units
+    return conflict
+
+def open_literals(state: SolverState) -> Tuple[np.ndarray, np.ndarray]:
+    # Row var holds (var, -var): occurrences in unsatisfied clauses and their JW scores, zero
+    # for assigned variables.
+    if state.applied < state.trail_len:
+        satisfy_nb(*counter_args(state), state.applied, state.trail_len)
+        state.applied = state.trail_len
+    counts = state.alive.reshape(-1, 2) * (state.assignment < 0)[:, None]
+    return counts, np.where(counts > 0, state.alive_weight.reshape(-1, 2), 0.0)
+
+def pure_literal_elimination(state: SolverState, counts: np.ndarray, stats: SolverStats) -> bool:
+    positive, negative = counts[:, 0] > 0, counts[:, 1] > 0
+    pure_literals = np.flatnonzero(positive & ~negative).tolist() + (-np.flatnonzero(negative & ~positive)).tolist()
+    for lit in pure_literals:
+        stats.pure_eliminations += 1
+        assign(state, lit)
+    return bool(pure_literals)
+
+def dpll(state: SolverState, stats: SolverStats, deadline: Optional[float] = None) -> bool:
+    # flipped[i] is True once decision level i + 1 has moved on to its negative branch.
+    flipped: List[bool] = []
+    while True:
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError()
+        if propagate(state, stats):
+            while flipped and flipped[-1]:
+                flipped.pop()
+            if not flipped:
+                return False
+            level = len(flipped) - 1
+            var = int(state.trail[state.trail_lim[level]])
+            backtrack(state, level)
+            flipped[-1] = True
+            stats.decisions += 1
+            state.trail_lim.append(state.trail_len)
+            assign(state, -var)
+            continue
+        counts, scores = open_literals(state)
+        while pure_literal_elimination(state, counts, stats):
+            propagate(state, stats)
+            counts, scores = open_literals(state)
+        best = int(np.argmax(scores))
+        if scores.flat[best] == 0:
+            return True
+        flipped.append(False)
+        stats.decisions += 1
+        state.trail_lim.append(state.trail_len)
+        assign(state, best >> 1)
+
+def run_solver(cnf: Path | CNFFormula, deadline: Optional[float] = None) -> Dict[str, object]:
+    formula = load_formula(cnf)
+    stats = SolverStats()
+    state = initialize_state(formula.clauses, formula.num_vars)
+    sat = True
+    for clause in formula.clauses:
+        if len(clause) == 1:
+            val = lit_value(state, clause[0])
+            if val is None:
+                assign(state, clause[0])
+            elif not val:
+                sat = False
+                break
+    sat = sat and dpll(state, stats, deadline)
+    result = {
+        "solver": "dpll_jw",
+        "status": "SAT" if sat else "UNSAT",
+        "decisions": stats.decisions,
+        "unit_propagations": stats.unit_propagations,
+        "pure_eliminations": stats.pure_eliminations,
+        "num_vars": formula.num_vars,
+        "num_clauses": formula.num_clauses,
+    }
+    if sat:
+        result["assignment_bits"] = encode_assignment(state.assignment)
+    return result
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cnf", required=True)
+    args = parser.parse_args()
+    start = time.perf_counter()
+    result = run_solver(Path(args.cnf))
+    result["wall_time"] = time.perf_counter() - start
+    print(json.dumps(result))
+
+if __name__ == "__main__":
+    main()
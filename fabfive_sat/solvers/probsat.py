@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from fabfive_sat.utils.cnf_parser import CNFFormula, load_formula
+from fabfive_sat.utils.cnf_flatten import FlatCNF, flatten_cnf
+from fabfive_sat.utils.assignment_bits import encode_assignment
+from fabfive_sat.solvers._local_search_core import collect_unsat_nb, count_true_nb, flip_nb, flip_scores_nb
+from fabfive_sat.solvers._portfolio import run_portfolio
+
+
+Clause = List[int]
+DEADLINE_INTERVAL = 64
+
+
+@dataclass
+class SolverStats:
+    flips: int = 0
+    restarts: int = 0
+
+
+def initialize_assignment(num_vars: int, rng: np.random.Generator) -> np.ndarray:
+    assignment = rng.integers(0, 2, size=num_vars + 1, dtype=np.int8)
+    assignment[0] = 0
+    return assignment
+
+
+def flip_variable(
+    flat: FlatCNF,
+    assignment: np.ndarray,
+    sat_count: np.ndarray,
+    unsat: np.ndarray,
+    unsat_pos: np.ndarray,
+    num_unsat: int,
+    var: int,
+) -> int:
+    return flip_nb(flat[2], flat[3], assignment, sat_count, unsat, unsat_pos, num_unsat, var)
+
+
+def select_variable_probabilistic(
+    clause: int,
+    flat: FlatCNF,
+    assignment: np.ndarray,
+    sat_count: np.ndarray,
+    scores: np.ndarray,
+    epsilon: float,
+    rng: np.random.Generator,
+) -> int:
+    lits, starts, occ, occ_off = flat
+    clause_vars = np.abs(lits[starts[clause] : starts[clause + 1]])
+    # Scores are the change in unsatisfied clauses; the common offset cancels in the normalization.
+    flip_scores_nb(lits, starts, occ, occ_off, assignment, sat_count, clause, scores)
+    cumulative = np.cumsum(np.power(epsilon, scores[: len(clause_vars)], dtype=np.float64))
+    pick = int(np.searchsorted(cumulative, rng.random() * cumulative[-1]))
+    return int(clause_vars[min(pick, len(clause_vars) - 1)])
+
+
+def prob_sat(
+    flat: FlatCNF,
+    num_vars: int,
+    max_flips: int,
+    epsilon: float,
+    stats: SolverStats,
+    rng: np.random.Generator,
+    deadline: Optional[float] = None,
+    stop=None,
+) -> np.ndarray | None:
+    lits, starts, occ, occ_off = flat
+    assignment = initialize_assignment(max(num_vars, (len(occ_off) - 3) // 2), rng)
+    sat_count = np.zeros(len(starts) - 1, dtype=np.int32)
+    count_true_nb(lits, starts, assignment, sat_count)
+    unsat = np.zeros(len(starts) - 1, dtype=np.int32)
+    unsat_pos = np.zeros(len(starts) - 1, dtype=np.int32)
+    num_unsat = collect_unsat_nb(sat_count, unsat, unsat_pos)
+    scores = np.zeros(int(np.diff(starts).max(initial=0)), dtype=np.int32)
+    for step in range(max_flips):
+        if step % DEADLINE_INTERVAL == 0:
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError()
+            if stop is not None and stop.is_set():
+                return None
+        if not num_unsat:
+            return assignment
+        clause = int(unsat[rng.integers(num_unsat)])
+        var = select_variable_probabilistic(clause, flat, assignment, sat_count, scores, epsilon, rng)
+        num_unsat = flip_variable(flat, assignment, sat_count, unsat, unsat_pos, num_unsat, var)
+        stats.flips += 1
+    return None
+
+
+def prob_sat_restart(seed: int, stop, flat: FlatCNF, num_vars: int, max_flips: int, epsilon: float, deadline: Optional[float]) -> Tuple[np.ndarray | None, int]:
+    stats = SolverStats()
+    assignment = prob_sat(flat, num_vars, max_flips, epsilon, stats, np.random.default_rng(seed), deadline, stop)
+    return assignment, stats.flips
+
+
+def run_solver(
+    cnf: Path | CNFFormula,
+    max_flips: int,
+    epsilon: float,
+    restarts: int,
+    deadline: Optional[float] = None,
+    workers: int = 1,
+) -> Dict[str, object]:
+    formula = load_formula(cnf)
+    flat = flatten_cnf(formula.clauses, formula.num_vars)
+    # Seeded from the random module so random.seed() keeps runs reproducible.
+    base_seed = random.getrandbits(64)
+    stats = SolverStats()
+    best_assignment = None
+    if workers > 1 and restarts > 1:
+        best_assignment, stats.flips, stats.restarts = run_portfolio(
+            prob_sat_restart,
+            (flat, formula.num_vars, max_flips, epsilon, deadline),
+            [base_seed + attempt for attempt in range(restarts)],
+            min(workers, restarts),
+        )
+    else:
+        rng = np.random.default_rng(base_seed)
+        for attempt in range(restarts):
+            assignment = prob_sat(flat, formula.num_vars, max_flips, epsilon, stats, rng, deadline)
+            if assignment is not None:
+                best_assignment = assignment
+                break
+            stats.restarts += 1
+    status = "SAT" if best_assignment is not None else "UNKNOWN"
+    result = {
+        "solver": "probsat",
+        "status": status,
+        "flips": stats.flips,
+        "restarts": stats.restarts,
+        "num_vars": formula.num_vars,
+        "num_clauses": formula.num_clauses,
+    }
+    if best_assignment is not None:
+        result["assignment_bits"] = encode_assignment(best_assignment)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cnf", required=True)
+    parser.add_argument("--max-flips", type=int, default=10000)
+    parser.add_argument("--epsilon", type=float, default=0.5)
+    parser.add_argument("--restarts", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+    if args.seed is not None:
+        random.seed(args.seed)
+    start = time.perf_counter()
+    result = run_solver(Path(args.cnf), args.max_flips, args.epsilon, args.restarts, workers=args.workers)
+    result["wall_time"] = time.perf_counter() - start
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from fabfive_sat.utils.cnf_parser import CNFFormula, load_formula
+from fabfive_sat.utils.cnf_flatten import FlatCNF, flatten_cnf
+from fabfive_sat.utils.assignment_bits import encode_assignment
+from fabfive_sat.solvers._local_search_core import collect_unsat_nb, flip_counts_nb, init_counts_nb
+from fabfive_sat.solvers._portfolio import run_portfolio
+
+
+Clause = List[int]
+DEADLINE_INTERVAL = 64
+
+
+@dataclass
+class SolverStats:
+    flips: int = 0
+    restarts: int = 0
+
+
+def initialize_assignment(num_vars: int) -> np.ndarray:
+    assignment = np.zeros(num_vars + 1, dtype=np.int8)
+    assignment[1:] = [random.choice((1, 0)) for _ in range(num_vars)]
+    return assignment
+
+
+@dataclass
+class WalkState:
+    assignment: np.ndarray
+    sat_count: np.ndarray
+    crit_sum: np.ndarray
+    break_count: np.ndarray
+    make_count: np.ndarray
+    unsat: np.ndarray
+    unsat_pos: np.ndarray
+    num_unsat: int = 0
+
+
+def initialize_state(flat: FlatCNF, num_vars: int) -> WalkState:
+    lits, starts, _, occ_off = flat
+    num_vars = max(num_vars, (len(occ_off) - 3) // 2)
+    state = WalkState(
+        assignment=initialize_assignment(num_vars),
+        sat_count=np.zeros(len(starts) - 1, dtype=np.int32),
+        crit_sum=np.zeros(len(starts) - 1, dtype=np.int64),
+        break_count=np.zeros(num_vars + 1, dtype=np.int32),
+        make_count=np.zeros(num_vars + 1, dtype=np.int32),
+        unsat=np.zeros(len(starts) - 1, dtype=np.int32),
+        unsat_pos=np.zeros(len(starts) - 1, dtype=np.int32),
+    )
+    init_counts_nb(lits, starts, state.assignment, state.sat_count, state.crit_sum, state.break_count, state.make_count)
+    state.num_unsat = collect_unsat_nb(state.sat_count, state.unsat, state.unsat_pos)
+    return state
+
+
+def flip_variable(flat: FlatCNF, state: WalkState, var: int) -> None:
+    lits, starts, occ, occ_off = flat
+    state.num_unsat = flip_counts_nb(
+        lits,
+        starts,
+        occ,
+        occ_off,
+        state.assignment,
+        state.sat_count,
+        state.crit_sum,
+        state.break_count,
+        state.make_count,
+        state.unsat,
+        state.unsat_pos,
+        state.num_unsat,
+        var,
+    )
+
+
+def walk_sat(
+    flat: FlatCNF,
+    num_vars: int,
+    max_flips: int,
+    noise: float,
+    stats: SolverStats,
+    deadline: Optional[float] = None,
+    stop=None,
+) -> np.ndarray | None:
+    lits, starts = flat[0], flat[1]
+    state = initialize_state(flat, num_vars)
+    for step in range(max_flips):
+        if step % DEADLINE_INTERVAL == 0:
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError()
+            if stop is not None and stop.is_set():
+                return None
+        if not state.num_unsat:
+            return state.assignment
+        clause = int(state.unsat[random.randrange(state.num_unsat)])
+        clause_vars = np.abs(lits[starts[clause] : starts[clause + 1]])
+        stats.flips += 1
+        if random.random() < noise:
+            flip_variable(flat, state, int(random.choice(clause_vars)))
+            continue
+        # break - make is the change in unsatisfied clauses the flip would cause.
+        best = int(np.argmin(state.break_count[clause_vars] - state.make_count[clause_vars]))
+        flip_variable(flat, state, int(clause_vars[best]))
+    return None
+
+
+def walk_sat_restart(seed: int, stop, flat: FlatCNF, num_vars: int, max_flips: int, noise: float, deadline: Optional[float]) -> Tuple[np.ndarray | None, int]:
+    random.seed(seed)
+    stats = SolverStats()
+    assignment = walk_sat(flat, num_vars, max_flips, noise, stats, deadline, stop)
+    return assignment, stats.flips
+
+
+def run_solver(
+    cnf: Path | CNFFormula,
+    max_flips: int,
+    noise: float,
+    restarts: int,
+    deadline: Optional[float] = None,
+    workers: int = 1,
+) -> Dict[str, object]:
+    formula = load_formula(cnf)
+    flat = flatten_cnf(formula.clauses, formula.num_vars)
+    stats = SolverStats()
+    best_assignment = None
+    if workers > 1 and restarts > 1:
+        base_seed = random.getrandbits(32)
+        best_assignment, stats.flips, stats.restarts = run_portfolio(
+            walk_sat_restart,
+            (flat, formula.num_vars, max_flips, noise, deadline),
+            [base_seed + attempt for attempt in range(restarts)],
+            min(workers, restarts),
+        )
+    else:
+        for attempt in range(restarts):
+            assignment = walk_sat(flat, formula.num_vars, max_flips, noise, stats, deadline)
+            if assignment is not None:
+                best_assignment = assignment
+                break
+            stats.restarts += 1
+    status = "SAT" if best_assignment is not None else "UNKNOWN"
+    result = {
+        "solver": "walksat",
+        "status": status,
+        "flips": stats.flips,
+        "restarts": stats.restarts,
+        "num_vars": formula.num_vars,
+        "num_clauses": formula.num_clauses,
+    }
+    if best_assignment is not None:
+        result["assignment_bits"] = encode_assignment(best_assignment)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cnf", required=True)
+    parser.add_argument("--max-flips", type=int, default=10000)
+    parser.add_argument("--noise", type=float, default=0.5)
+    parser.add_argument("--restarts", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+    if args.seed is not None:
+        random.seed(args.seed)
+    start = time.perf_counter()
+    result = run_solver(Path(args.cnf), args.max_flips, args.noise, args.restarts, workers=args.workers)
+    result["wall_time"] = time.perf_counter() - start
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+from __future__ import annotations
+import numpy as np
+
+# Solver results carry a model as one character per variable: bits[var - 1] is "1" exactly
+# when var is true. Unassigned variables (value -1) are don't-cares and encode as "0".
+
+def encode_assignment(values: np.ndarray) -> str:
+    return ((values[1:] > 0).astype(np.uint8) + ord("0")).tobytes().decode("ascii")
+
+def decode_assignment(bits: str) -> np.ndarray:
+    values = np.empty(len(bits) + 1, dtype=np.int8)
+    values[0] = -1
+    values[1:] = np.frombuffer(bits.encode("ascii"), dtype=np.uint8) - ord("0")
+    return values
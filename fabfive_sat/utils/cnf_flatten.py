@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from itertools import chain
+from typing import List, Tuple
+
+import numpy as np
+
+FlatCNF = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def literal_index(lits: np.ndarray) -> np.ndarray:
+    return (np.abs(lits) << 1) | (lits < 0)
+
+
+def flatten_cnf(clauses: List[List[int]], num_vars: int = 0) -> FlatCNF:
+    # CSR layout: clause c is lits[starts[c]:starts[c + 1]], and the clauses containing
+    # literal l are watches_lit[watches_off[i]:watches_off[i + 1]] with i = literal_index(l).
+    lengths = np.fromiter(map(len, clauses), dtype=np.int32, count=len(clauses))
+    lits = np.fromiter(chain.from_iterable(clauses), dtype=np.int32, count=int(lengths.sum()))
+    starts = np.zeros(len(clauses) + 1, dtype=np.int32)
+    np.cumsum(lengths, out=starts[1:])
+    num_vars = max(num_vars, int(np.abs(lits).max(initial=0)))
+    keys = literal_index(lits)
+    order = np.argsort(keys, kind="stable")
+    watches_lit = np.repeat(np.arange(len(clauses), dtype=np.int32), lengths)[order]
+    watches_off = np.zeros(2 * num_vars + 3, dtype=np.int32)
+    np.cumsum(np.bincount(keys, minlength=2 * num_vars + 2), out=watches_off[1:])
+    return lits, starts, watches_lit, watches_off
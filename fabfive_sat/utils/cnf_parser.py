@@ -0,0 +1,52 @@
+import re
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+
+@dataclass
+class CNFFormula:
+    num_vars: int
+    num_clauses: int
+    clauses: List[List[int]]
+
+
+# Comment, problem and SATLIB "%" trailer lines; everything else is a stream of literals
+# where 0 terminates a clause.
+SKIP_LINE = re.compile(rb"^\s*[cp%].*$", re.M)
+PROBLEM_LINE = re.compile(rb"^\s*p\s+\S+\s+(\d+)\s+(\d+)", re.M)
+
+
+def parse_dimacs_bytes(data: bytes) -> CNFFormula:
+    header = PROBLEM_LINE.search(data)
+    num_vars = int(header.group(1)) if header else 0
+    num_clauses = int(header.group(2)) if header else 0
+    with warnings.catch_warnings():
+        # Makes np.fromstring raise on a malformed token instead of silently stopping there.
+        warnings.simplefilter("error", DeprecationWarning)
+        ints = np.fromstring(SKIP_LINE.sub(b"", data).decode("ascii"), dtype=np.int64, sep=" ")
+    flat = ints.tolist()
+    zeros = np.flatnonzero(ints == 0).tolist()
+    starts = [0] + [end + 1 for end in zeros]
+    ends = zeros + [len(flat)]
+    clauses = [flat[start:end] for start, end in zip(starts, ends) if end > start]
+    if not num_clauses:
+        num_clauses = len(clauses)
+    return CNFFormula(num_vars=num_vars, num_clauses=num_clauses, clauses=clauses)
+
+
+def parse_dimacs(path: str | Path) -> CNFFormula:
+    return parse_dimacs_bytes(Path(path).read_bytes())
+
+
+def parse_from_string(data: str) -> CNFFormula:
+    return parse_dimacs_bytes(data.encode("ascii"))
+
+
+def load_formula(source: str | Path | CNFFormula) -> CNFFormula:
+    if isinstance(source, CNFFormula):
+        return source
+    return parse_dimacs(source)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+import json
+import sys
+from itertools import chain
+from pathlib import Path
+from typing import List, Dict
+import numpy as np
+
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from fabfive_sat.utils.sudoku_encoder import encode, write_dimacs
+
+DIGITS = range(1, 10)
+SIZE = 9
+
+def parse_grid_from_string(grid_str: str | List[str] | List[List[int]]) -> np.ndarray:
+    if isinstance(grid_str, list):
+        grid_str = "".join(map(str, chain.from_iterable(grid_str)))
+    clean = grid_str.encode("ascii").translate(None, b"\n ")
+    if len(clean) != 81:
+        raise ValueError("Invalid grid string length")
+    # Bytes below "0" wrap around in uint8, so one bound check rejects every non-digit.
+    digits = np.frombuffer(clean, dtype=np.uint8) - ord("0")
+    if digits.max() > 9:
+        raise ValueError("Invalid grid character")
+    return digits.astype(np.int8).reshape(SIZE, SIZE)
+
+def grid_to_string(grid: List[List[int]] | np.ndarray) -> List[str]:
+    text = (np.asarray(grid, dtype=np.uint8) + ord("0")).tobytes().decode("ascii")
+    return [text[i : i + SIZE] for i in range(0, SIZE * SIZE, SIZE)]
+
+def permute_sudoku(grid: List[List[int]] | np.ndarray) -> np.ndarray:
+    g = np.asarray(grid, dtype=np.int8)
+    mapping = np.concatenate(([0], np.random.permutation(9) + 1)).astype(np.int8)
+    g = mapping[g]
+    rows = np.concatenate([band * 3 + np.random.permutation(3) for band in range(3)])
+    cols = np.concatenate([stack * 3 + np.random.permutation(3) for stack in range(3)])
+    return g[rows][:, cols]
+
+def make_unsolvable(grid: List[List[int]] | np.ndarray) -> np.ndarray:
+    g = np.array(grid, dtype=np.int8)
+    filled = np.argwhere(g != 0)
+    if not len(filled):
+        return g
+    r, c = filled[np.random.randint(len(filled))]
+    others = np.flatnonzero(g[r] != 0)
+    others = others[others != c]
+    if len(others):
+        g[r, c] = g[r, others[0]]
+    return g
+
+def generate_dataset(seed_path: Path, output_json: Path, count: int = 25):
+    with open(seed_path, 'r') as f:
+        lines = [l.strip() for l in f if l.strip()]
+    seed_grid = parse_grid_from_string(lines)
+    puzzles = []
+    for i in range(count - 5):
+        p = permute_sudoku(seed_grid)
+        puzzles.append({
+            "id": f"sudoku_sat_{i+1:02d}",
+            "type": "satisfiable",
+            "grid": grid_to_string(p)
+        })
+    for i in range(5):
+        p = permute_sudoku(seed_grid)
+        p = make_unsolvable(p)
+        puzzles.append({
+            "id": f"sudoku_unsat_{i+1:02d}",
+            "type": "unsolvable",
+            "grid": grid_to_string(p)
+        })
+    output_json.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_json, 'w') as f:
+        json.dump(puzzles, f, indent=2)
+
+def export_to_cnf(json_path: Path, output_dir: Path):
+    with open(json_path, 'r') as f:
+        puzzles = json.load(f)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for p in puzzles:
+        grid = parse_grid_from_string(p['grid'])
+        clauses = encode(grid)        
+        filename = output_dir / f"{p['id']}.cnf"
+        write_dimacs(filename, clauses)
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", default="puzzles/sudoku_easy.csv")
+    parser.add_argument("--json-out", default="puzzles/sudoku_puzzles.json")
+    parser.add_argument("--cnf-dir", default="benchmarks/sudoku")
+    args = parser.parse_args()
+    generate_dataset(Path(args.seed), Path(args.json_out))
+    export_to_cnf(Path(args.json_out), Path(args.cnf_dir))
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import argparse
+from functools import cache
+from itertools import combinations
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+DIGITS = range(1, 10)
+SIZE = 9
+BOX = 3
+# VARIABLES[r, c, v - 1] == var_index(r, c, v)
+VARIABLES = np.arange(1, SIZE ** 3 + 1, dtype=np.int64).reshape(SIZE, SIZE, SIZE)
+AMO_PAIRS = np.array(list(combinations(range(SIZE), 2)))
+
+
+def var_index(row: int, col: int, value: int) -> int:
+    return row * SIZE * SIZE + col * SIZE + value
+
+
+def parse_puzzle(path: Path) -> List[List[int]]:
+    rows: List[List[int]] = []
+    for line in path.read_text().splitlines():
+        text = line.strip()
+        if not text:
+            continue
+        if len(text) != SIZE:
+            raise ValueError("invalid row length")
+        rows.append([int(ch) for ch in text])
+    if len(rows) != SIZE:
+        raise ValueError("invalid puzzle height")
+    return rows
+
+
+def group_clauses(groups: np.ndarray) -> List[List[int]]:
+    # Each row of groups is a set of SIZE variables needing exactly one true: an at-least-one
+    # clause followed by its at-most-one pairs in lexicographic order.
+    pairs = -groups[:, AMO_PAIRS]
+    block = 1 + len(AMO_PAIRS)
+    clauses: List[List[int]] = [None] * (len(groups) * block)
+    clauses[::block] = groups.tolist()
+    for k in range(len(AMO_PAIRS)):
+        clauses[1 + k :: block] = pairs[:, k].tolist()
+    return clauses
+
+
+def cell_clauses() -> List[List[int]]:
+    return group_clauses(VARIABLES.reshape(SIZE * SIZE, SIZE))
+
+
+def row_clauses() -> List[List[int]]:
+    return group_clauses(VARIABLES.transpose(0, 2, 1).reshape(SIZE * SIZE, SIZE))
+
+
+def column_clauses() -> List[List[int]]:
+    return group_clauses(VARIABLES.transpose(1, 2, 0).reshape(SIZE * SIZE, SIZE))
+
+
+def box_clauses() -> List[List[int]]:
+    boxes = VARIABLES.reshape(BOX, BOX, BOX, BOX, SIZE).transpose(0, 2, 4, 1, 3)
+    return group_clauses(boxes.reshape(SIZE * SIZE, SIZE))
+
+
+def clue_clauses(puzzle: List[List[int]] | np.ndarray) -> List[List[int]]:
+    grid = np.asarray(puzzle, dtype=np.int64)
+    rows, cols = np.nonzero(grid)
+    return VARIABLES[rows, cols, grid[rows, cols] - 1].reshape(-1, 1).tolist()
+
+
+@cache
+def skeleton_clauses() -> List[List[int]]:
+    # The puzzle-independent rules; callers share the clause lists and must not mutate them.
+    return cell_clauses() + row_clauses() + column_clauses() + box_clauses()
+
+
+def encode(puzzle: List[List[int]]) -> List[List[int]]:
+    return skeleton_clauses() + clue_clauses(puzzle)
+
+
+def write_dimacs(path: Path, clauses: List[List[int]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    total_vars = SIZE * SIZE * SIZE
+    body = "".join(f"{' '.join(map(str, clause))} 0\n" for clause in clauses)
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+        handle.write(f"p cnf {total_vars} {len(clauses)}\n{body}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", required=True)
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args()
+    puzzle = parse_puzzle(Path(args.input))
+    clauses = encode(puzzle)
+    write_dimacs(Path(args.output), clauses)
+
+
+if __name__ == "__main__":
+    main()